@@ -2,21 +2,116 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import datetime
+import errno
+import functools
+import glob
+import html
+import importlib.util
+import itertools
+import math
+import re
+import stat
+import string
 import sys
 import textwrap
+import warnings
+from collections import Counter
 from pathlib import Path
-from typing import Union
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence, Union
 
-import pandas as pd
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+_HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
 
 
 class ConversionError(Exception):
     """Raised when an import or export action fails."""
 
 
+class _ChunkDtypeMismatch(Exception):
+    """Raised when a later CSV chunk cannot be parsed with the first chunk's dtypes."""
+
+
 SheetSelector = Union[str, int]
 
 
+def _import_pandas():
+    """Import pandas on first use so ``--help`` does not pay for it."""
+    try:
+        import pandas as pd
+    except ImportError as exc:
+        raise ConversionError(
+            "pandas is required for this conversion. Install with: pip install pandas openpyxl"
+        ) from exc
+    return pd
+
+
+_EXCEL_MAX_ROWS = 1_048_576
+_EXCEL_MAX_COLUMNS = 16_384
+_INVALID_SHEET_CHARS = frozenset("[]:*?/\\")
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    "<sheets><sheet name={name} sheetId=\"1\" r:id=\"rId1\"/></sheets>"
+    "</workbook>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_XLSX_SHEET_TAIL = "</sheetData></worksheet>"
+_XLSX_FLUSH_ROWS = 1024
+# Deflate level 1 instead of zlib's default 6 cuts large sheet writes by roughly
+# 40% for files about 15% bigger.
+_XLSX_COMPRESSLEVEL = 1
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_CSV_CHUNK_ROWS = 65_536
+_CSV_MEMORY_MAP_BYTES = 50_000_000
+# The C engine's boolean spellings. pyarrow also treats "1" and "0" as booleans
+# by default, which would turn numeric-looking text columns into TRUE/FALSE.
+_CSV_TRUE_VALUES = ["True", "TRUE", "true"]
+_CSV_FALSE_VALUES = ["False", "FALSE", "false"]
+_EXCEL_READ_ENGINES = ("calamine", "openpyxl") if _HAS_CALAMINE else ("openpyxl",)
+
+
 def csv_to_excel(
     csv_path: Path,
     excel_path: Path,
@@ -29,33 +124,492 @@ def csv_to_excel(
     include_index: bool = False,
 ) -> None:
     """Convert a CSV file into an Excel workbook."""
+    pd = _import_pandas()
     csv_path = Path(csv_path)
     excel_path = Path(excel_path)
 
-    if not csv_path.exists():
-        raise ConversionError(f"CSV file not found: {csv_path}")
-
     header = 0 if has_header else None
     try:
-        frame = pd.read_csv(csv_path, sep=delimiter, encoding=encoding, header=header)
+        options = {"sep": delimiter, "encoding": encoding, "header": header}
+        info = csv_path.stat()
+        # Pipes and process substitutions can only be read once.
+        rereadable = stat.S_ISREG(info.st_mode)
+        if info.st_size > _CSV_MEMORY_MAP_BYTES:
+            # Parse large files straight from the page cache instead of copying
+            # them through read() buffers. Pipes report a size of zero and empty
+            # files cannot be mapped, so both keep the plain reader.
+            options["memory_map"] = True
+        # Transposing needs every row up front, and streaming opens the file
+        # more than once, so only stream untransposed regular files.
+        streaming = rereadable and not transpose
+        if streaming:
+            chunks = _read_csv_chunks(csv_path, **options)
+            first_chunk = next(chunks)
+        else:
+            frame = _read_csv_frame(csv_path, rereadable=rereadable, **options)
     except Exception as exc:
-        raise ConversionError(f"Unable to read CSV '{csv_path}': {exc}") from exc
-
-    if transpose:
-        frame = frame.transpose(copy=True)
+        raise _csv_read_error(csv_path, exc) from exc
 
     try:
         excel_path.parent.mkdir(parents=True, exist_ok=True)
-        frame.to_excel(
-            excel_path,
-            sheet_name=sheet_name,
-            index=include_index,
-            engine="openpyxl",
-        )
+        if not streaming:
+            _write_excel_fast(frame, excel_path, sheet_name, include_index, transpose)
+            return
+        try:
+            _write_excel_chunks(
+                itertools.chain([first_chunk], chunks),
+                excel_path,
+                sheet_name,
+                include_index,
+            )
+            return
+        except _ChunkDtypeMismatch:
+            pass
+    except Exception as exc:
+        raise ConversionError(f"Unable to write Excel '{excel_path}': {exc}") from exc
+
+    # A later chunk disagreed with the dtypes inferred from the first one, e.g. a
+    # numeric column turning textual past row 65,536. Parse the whole file at once
+    # with the same C engine so every column is typed the same way top to bottom.
+    try:
+        frame = pd.read_csv(csv_path, **options)
+    except Exception as exc:
+        raise _csv_read_error(csv_path, exc) from exc
+    try:
+        _write_excel_fast(frame, excel_path, sheet_name, include_index)
     except Exception as exc:
         raise ConversionError(f"Unable to write Excel '{excel_path}': {exc}") from exc
 
 
+def _csv_read_error(csv_path: Path, exc: Exception) -> ConversionError:
+    if isinstance(exc, ConversionError):
+        return exc
+    if isinstance(exc, FileNotFoundError):
+        return ConversionError(f"CSV file not found: {csv_path}")
+    return ConversionError(f"Unable to read CSV '{csv_path}': {exc}")
+
+
+def _read_csv_frame(csv_path: Path, *, rereadable: bool = True, **options: Any) -> pd.DataFrame:
+    """Read a whole CSV, preferring pyarrow's multithreaded parser when installed.
+
+    pyarrow is skipped unless ``rereadable``, since matching the C engine's
+    header labels takes a second pass over the file.
+    """
+    import pandas as pd
+
+    if _HAS_PYARROW and rereadable:
+        try:
+            frame = _read_csv_arrow(csv_path, **options)
+        except ValueError:
+            # Unsupported options or malformed input: let the C engine decide.
+            frame = None
+        if frame is not None:
+            return frame
+    return pd.read_csv(csv_path, **options)
+
+
+def _read_csv_arrow(csv_path: Path, **options: Any) -> Optional[pd.DataFrame]:
+    """Read a CSV with the pyarrow engine, typed exactly as the C engine would.
+
+    Returns ``None`` when the result cannot be reconciled with the C engine.
+    """
+    import pandas as pd
+
+    # pyarrow reads files natively and rejects the C engine's memory_map flag.
+    arrow_options = {key: value for key, value in options.items() if key != "memory_map"}
+    frame = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        true_values=_CSV_TRUE_VALUES,
+        false_values=_CSV_FALSE_VALUES,
+        **arrow_options,
+    )
+
+    # pyarrow infers dates, times and timestamps that the C engine leaves as text.
+    # pandas casts them back to strings only after parsing, which loses the
+    # original spelling, so leave such files to the C engine.
+    if _has_temporal_columns(frame):
+        return None
+
+    # pyarrow neither de-duplicates nor fills in blank header names, so take the
+    # labels from a header-only C engine read.
+    labels = pd.read_csv(csv_path, nrows=0, **options).columns
+    if len(labels) != frame.shape[1]:
+        return None
+    frame.columns = labels
+    return frame
+
+
+def _has_temporal_columns(frame: pd.DataFrame) -> bool:
+    """Return whether any column holds datetimes, dates or times."""
+    for position in range(frame.shape[1]):
+        column = frame.iloc[:, position]
+        if column.dtype.kind == "M":
+            return True
+        if column.dtype == object:
+            values = column.dropna()
+            if len(values) and isinstance(values.iloc[0], (datetime.date, datetime.time)):
+                return True
+    return False
+
+
+def _read_csv_chunks(csv_path: Path, **options: Any) -> Iterator[pd.DataFrame]:
+    """Yield the CSV in chunks typed with the dtypes inferred for the first chunk.
+
+    Pinning the dtypes keeps a column's cell types independent of where chunk
+    boundaries fall. A later chunk that does not fit them raises
+    ``_ChunkDtypeMismatch`` so the caller can re-read the file in one piece.
+    """
+    import pandas as pd
+
+    # Keep blank lines while sniffing: ``nrows`` skips them but ``skiprows``
+    # counts them, so only a sniff without any tells where the rest begins.
+    try:
+        first = pd.read_csv(csv_path, nrows=_CSV_CHUNK_ROWS, skip_blank_lines=False, **options)
+    except pd.errors.EmptyDataError:
+        # Blank leading lines, or an empty file; the sniff below sorts it out.
+        resume = False
+    else:
+        resume = not first.isna().all(axis=1).any()
+    if resume and options["header"] is not None:
+        # A blank line before the header would have been taken as the header.
+        resume = first.columns.equals(pd.read_csv(csv_path, nrows=0, **options).columns)
+    if not resume:
+        # Blank lines cannot be told apart from rows of empty fields here, so
+        # sniff the usual way and let the typed reader start from the top.
+        first = pd.read_csv(csv_path, nrows=_CSV_CHUNK_ROWS, **options)
+    yield first
+    if len(first) < _CSV_CHUNK_ROWS:
+        return
+
+    reader_options = {**options, "dtype": _chunk_dtypes(first), "chunksize": _CSV_CHUNK_ROWS}
+    if resume:
+        # Continue right after the sniffed rows instead of parsing them again.
+        skip = _CSV_CHUNK_ROWS
+        if options["header"] is not None:
+            skip += 1
+            reader_options.update(header=None, names=list(first.columns))
+        reader_options["skiprows"] = skip
+    reader = pd.read_csv(csv_path, **reader_options)
+    with reader:
+        iterator = iter(reader)
+        # Without ``resume`` the first chunk was already yielded from the sniff.
+        skip_first = not resume
+        while True:
+            try:
+                with warnings.catch_warnings():
+                    # Failed casts warn before they raise; the raise is handled below.
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    chunk = next(iterator)
+            except StopIteration:
+                return
+            except Exception as exc:
+                raise _ChunkDtypeMismatch(str(exc)) from exc
+            if skip_first:
+                skip_first = False
+                continue
+            if resume:
+                chunk.index += _CSV_CHUNK_ROWS
+            yield chunk
+
+
+def _chunk_dtypes(frame: pd.DataFrame) -> dict[Any, Any]:
+    """Return the dtypes to pin for the chunks following ``frame``.
+
+    Integer columns are widened to float64 so a blank cell further down does
+    not force a full re-read; Excel stores both as doubles anyway.
+    """
+    import numpy as np
+
+    return {
+        label: np.dtype("float64") if isinstance(dtype, np.dtype) and dtype.kind in "iu" else dtype
+        for label, dtype in frame.dtypes.items()
+    }
+
+
+def _write_excel_fast(
+    frame: pd.DataFrame,
+    excel_path: Path,
+    sheet_name: SheetSelector,
+    include_index: bool,
+    transpose: bool = False,
+) -> None:
+    """Write ``frame`` row by row through a streaming workbook writer.
+
+    ``DataFrame.to_excel`` builds the whole cell graph in memory before saving;
+    streaming rows keeps peak memory flat for tall frames. With ``transpose``
+    each column is written as a row, so the transposed frame is never built.
+    """
+    if not transpose:
+        _write_excel_chunks(iter([frame]), excel_path, sheet_name, include_index)
+        return
+
+    if not include_index and _fits_direct_xlsx(frame, transpose):
+        header = [_xlsx_value(label) for label in frame.index]
+        block = _fast_transpose(frame)
+        columns = [
+            _xlsx_cells(block[i] if block is not None else frame.iloc[:, i].to_numpy())
+            for i in range(frame.shape[1])
+        ]
+        _write_xlsx_direct(excel_path, str(sheet_name), itertools.chain([header], columns))
+        return
+
+    header = list(frame.index)
+    if include_index:
+        header.insert(0, frame.columns.name)
+    _write_rows(excel_path, str(sheet_name), header, _column_rows(frame, include_index))
+
+
+def _fast_transpose(frame: pd.DataFrame) -> Optional[np.ndarray]:
+    """Return a numeric frame as a C-ordered ``(columns, rows)`` array.
+
+    Mixed integer and float columns are upcast to their common dtype, just as
+    ``frame.T`` does. A homogeneous frame is stored as one 2D block already
+    laid out this way, so this is usually a view; otherwise it is a single
+    contiguous copy instead of one Series per column. Returns ``None`` for
+    non-numeric dtypes, and for booleans mixed with numbers, which ``frame.T``
+    turns into objects.
+    """
+    import numpy as np
+
+    dtypes = set(frame.dtypes)
+    if not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        return None
+    kinds = {dtype.kind for dtype in dtypes}
+    if not (kinds <= set("fiu") or kinds == {"b"}):
+        return None
+    return np.ascontiguousarray(frame.to_numpy().T)
+
+
+def _write_excel_chunks(
+    chunks: Iterator[pd.DataFrame],
+    excel_path: Path,
+    sheet_name: SheetSelector,
+    include_index: bool,
+) -> None:
+    """Stream consecutive frames sharing one header into a single worksheet.
+
+    The writer is picked from the first chunk; later chunks are rendered as
+    they arrive so only one chunk is held in memory at a time.
+    """
+    first = next(chunks)
+    chunks = itertools.chain([first], chunks)
+
+    if not include_index and _fits_direct_xlsx(first):
+        header = [_xlsx_value(label) for label in first.columns]
+        rows = itertools.chain.from_iterable(
+            zip(*(_xlsx_cells(chunk.iloc[:, i].to_numpy()) for i in range(chunk.shape[1])))
+            for chunk in chunks
+        )
+        _write_xlsx_direct(excel_path, str(sheet_name), itertools.chain([header], rows))
+        return
+
+    header = list(first.columns)
+    if include_index:
+        header.insert(0, first.index.name)
+    rows = itertools.chain.from_iterable(
+        chunk.itertuples(index=include_index, name=None) for chunk in chunks
+    )
+    _write_rows(excel_path, str(sheet_name), header, rows)
+
+
+def _column_rows(frame: pd.DataFrame, include_label: bool) -> Iterable[list[Any]]:
+    """Yield each column of ``frame`` as a row, optionally led by its label."""
+    block = _fast_transpose(frame)
+    for position, label in enumerate(frame.columns):
+        if block is not None:
+            values = block[position].tolist()
+        else:
+            values = frame.iloc[:, position].tolist()
+        yield [label, *values] if include_label else values
+
+
+def _write_rows(
+    excel_path: Path,
+    sheet_name: str,
+    header: Sequence[Any],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Stream ``header`` and ``rows`` into a single-sheet workbook.
+
+    Uses xlsxwriter in constant-memory mode when installed and falls back to
+    openpyxl's write-only workbook otherwise.
+    """
+    if len(header) > _EXCEL_MAX_COLUMNS:
+        raise ValueError(f"{len(header)} columns exceed Excel's limit of {_EXCEL_MAX_COLUMNS}")
+
+    if _HAS_XLSXWRITER:
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(
+            str(excel_path),
+            {"constant_memory": True, "strings_to_urls": False},
+        )
+        try:
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, _excel_row(header))
+            for row_number, row in enumerate(rows, start=1):
+                _check_row_limit(row_number)
+                worksheet.write_row(row_number, 0, _excel_row(row))
+        finally:
+            workbook.close()
+        return
+
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=sheet_name)
+    try:
+        worksheet.append(_excel_row(header))
+        for row_number, row in enumerate(rows, start=1):
+            _check_row_limit(row_number)
+            worksheet.append(_excel_row(row))
+    except BaseException:
+        # Finish the half-written temporary sheet so it is not left open.
+        worksheet.close()
+        raise
+    workbook.save(excel_path)
+
+
+def _check_row_limit(row_number: int) -> None:
+    """Fail instead of silently dropping rows past Excel's last row."""
+    if row_number >= _EXCEL_MAX_ROWS:
+        raise ValueError(f"data exceeds Excel's limit of {_EXCEL_MAX_ROWS} rows")
+
+
+def _fits_direct_xlsx(frame: pd.DataFrame, transpose: bool = False) -> bool:
+    """Return whether ``frame`` can skip the workbook libraries entirely."""
+    import numpy as np
+
+    rows, columns = frame.shape
+    if transpose:
+        rows, columns = columns, rows
+    if rows + 1 > _EXCEL_MAX_ROWS or columns > _EXCEL_MAX_COLUMNS:
+        return False
+    return all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in frame.dtypes
+    )
+
+
+def _write_xlsx_direct(
+    excel_path: Path,
+    sheet_name: str,
+    rows: Iterable[Sequence[Optional[str]]],
+) -> None:
+    """Emit a minimal single-sheet xlsx package straight into a ZIP archive.
+
+    Each row holds pre-rendered cell fragments (see ``_xlsx_cells``); ``None``
+    leaves the cell empty.
+    """
+    import zipfile
+
+    if not sheet_name or len(sheet_name) > 31 or _INVALID_SHEET_CHARS & set(sheet_name):
+        raise ValueError(f"Invalid Excel worksheet name: {sheet_name!r}")
+
+    with zipfile.ZipFile(
+        excel_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_XLSX_COMPRESSLEVEL
+    ) as archive:
+        archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        workbook = _XLSX_WORKBOOK.format(name=f'"{html.escape(sheet_name)}"')
+        archive.writestr("xl/workbook.xml", workbook)
+        archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(_XLSX_SHEET_HEAD.encode("utf-8"))
+            names = _COLUMN_NAMES
+            buffer = []
+            for row_number, row in enumerate(rows, start=1):
+                if row_number > _EXCEL_MAX_ROWS:
+                    raise ValueError(f"data exceeds Excel's limit of {_EXCEL_MAX_ROWS} rows")
+                cells = "".join(
+                    f'<c r="{names[column]}{row_number}"{cell}</c>'
+                    for column, cell in enumerate(row)
+                    if cell is not None
+                )
+                buffer.append(f'<row r="{row_number}">{cells}</row>')
+                if len(buffer) >= _XLSX_FLUSH_ROWS:
+                    sheet.write("".join(buffer).encode("utf-8"))
+                    buffer.clear()
+            buffer.append(_XLSX_SHEET_TAIL)
+            sheet.write("".join(buffer).encode("utf-8"))
+
+
+def _build_column_names() -> tuple[str, ...]:
+    """List every column reference from A to XFD in column order."""
+    letters = string.ascii_uppercase
+    pairs = [first + second for first in letters for second in letters]
+    triples = [first + pair for first in letters for pair in pairs]
+    return tuple([*letters, *pairs, *triples][:_EXCEL_MAX_COLUMNS])
+
+
+# Indexed by zero-based column number so cell references never redo the
+# base-26 conversion.
+_COLUMN_NAMES = _build_column_names()
+
+
+def _xlsx_cells(values: np.ndarray) -> list[Optional[str]]:
+    """Render a column into cell fragments for ``_write_xlsx_direct``."""
+    import numpy as np
+
+    if values.dtype.kind not in "biuf":
+        return [_xlsx_value(value) for value in values.tolist()]
+    if values.dtype.kind == "b":
+        return [' t="b"><v>1</v>' if value else ' t="b"><v>0</v>' for value in values.tolist()]
+    text = values.astype(str).tolist()
+    if values.dtype.kind != "f":
+        return [f"><v>{value}</v>" for value in text]
+    finite = np.isfinite(values).tolist()
+    # NumPy spells non-finite floats "nan", "inf" and "-inf"; NaN stays empty.
+    non_finite = {"inf": _xlsx_value("inf"), "-inf": _xlsx_value("-inf")}
+    return [
+        f"><v>{value}</v>" if keep else non_finite.get(value)
+        for value, keep in zip(text, finite)
+    ]
+
+
+def _xlsx_value(value: Any) -> Optional[str]:
+    """Render a single value as a numeric or inline-string cell fragment."""
+    value = _excel_value(value)
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return f' t="b"><v>{int(value)}</v>'
+    if isinstance(value, Real):
+        return f"><v>{value}</v>"
+    text = _ILLEGAL_XML_CHARS.sub("", str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f' t="inlineStr"><is><t{space}>{html.escape(text, quote=False)}</t></is>'
+
+
+def _excel_row(row: Sequence[Any]) -> list[Any]:
+    return [_excel_value(value) for value in row]
+
+
+def _excel_value(value: Any) -> Any:
+    """Blank out missing values and spell infinities as text, as ``to_excel`` does."""
+    if _is_null(value):
+        return None
+    if isinstance(value, float) and math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return value
+
+
+def _csv_row(row: Sequence[Any]) -> list[Any]:
+    """Render missing values as empty fields, matching ``DataFrame.to_csv``."""
+    return ["" if _is_null(value) else value for value in row]
+
+
+def _is_null(value: Any) -> bool:
+    """Detect None, NaN, ``pd.NaT`` and ``pd.NA`` without importing pandas."""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        # ``pd.NA`` refuses to be coerced to bool.
+        return True
+
+
 def excel_to_csv(
     excel_path: Path,
     csv_path: Path,
@@ -66,42 +620,235 @@ def excel_to_csv(
     transpose: bool = False,
     include_index: bool = False,
     include_header: bool = True,
+    raw_cells: bool = False,
 ) -> None:
-    """Convert an Excel worksheet into a CSV file."""
+    """Convert an Excel worksheet into a CSV file.
+
+    With ``raw_cells`` the worksheet is copied cell by cell through
+    python-calamine without building a DataFrame. That is faster, but cells
+    keep their stored values: headers are not de-duplicated or filled in,
+    blank rows are kept and numbers are not unified per column.
+    """
     excel_path = Path(excel_path)
     csv_path = Path(csv_path)
 
-    if not excel_path.exists():
-        raise ConversionError(f"Excel workbook not found: {excel_path}")
+    if raw_cells:
+        if transpose or include_index:
+            raise ConversionError("raw cell export cannot transpose or include an index")
+        rows = _read_sheet_rows(excel_path, sheet_name)
+        if not include_header:
+            rows = itertools.islice(rows, 1, None)
+        try:
+            csv_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(csv_path, "w", encoding=encoding, newline="") as handle:
+                writer = csv.writer(handle, delimiter=delimiter, lineterminator="\n")
+                writer.writerows(rows)
+        except Exception as exc:
+            raise ConversionError(f"Unable to write CSV '{csv_path}': {exc}") from exc
+        return
 
-    try:
-        frame = pd.read_excel(
-            excel_path,
-            sheet_name=sheet_name,
-            engine="openpyxl",
-        )
-    except Exception as exc:
-        raise ConversionError(
-            f"Unable to read worksheet '{sheet_name}' from '{excel_path}': {exc}"
-        ) from exc
-
-    if transpose:
-        frame = frame.transpose(copy=True)
+    _import_pandas()
+    frame = _read_excel_frame(excel_path, sheet_name)
 
     try:
         csv_path.parent.mkdir(parents=True, exist_ok=True)
+        if transpose:
+            _write_csv_transposed(
+                frame,
+                csv_path,
+                delimiter=delimiter,
+                encoding=encoding,
+                include_index=include_index,
+                include_header=include_header,
+            )
+            return
+        if _is_plain_frame(frame):
+            _write_csv_rows(
+                frame,
+                csv_path,
+                delimiter=delimiter,
+                encoding=encoding,
+                include_index=include_index,
+                include_header=include_header,
+            )
+            return
         frame.to_csv(
             csv_path,
             sep=delimiter,
             encoding=encoding,
             index=include_index,
             header=include_header,
-            line_terminator="\n",
+            lineterminator="\n",
         )
     except Exception as exc:
         raise ConversionError(f"Unable to write CSV '{csv_path}': {exc}") from exc
 
 
+def _read_sheet_rows(excel_path: Path, sheet_name: SheetSelector) -> Iterator[list[Any]]:
+    """Read raw worksheet rows with python-calamine, bypassing pandas.
+
+    The sheet is loaded up front so read errors surface here; rows are then
+    converted one at a time as they are consumed.
+    """
+    if not _HAS_CALAMINE:
+        raise ConversionError(
+            "raw cell export requires python-calamine. Install with: pip install python-calamine"
+        )
+
+    from python_calamine import CalamineWorkbook
+
+    try:
+        workbook = CalamineWorkbook.from_path(str(excel_path))
+        if isinstance(sheet_name, int):
+            sheet = workbook.get_sheet_by_index(sheet_name)
+        else:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        # Keep leading blank rows/columns so cells line up as in pd.read_excel.
+        rows = sheet.to_python(skip_empty_area=False)
+    except Exception as exc:
+        # python-calamine raises a bare OSError that only names the errno in its text.
+        if isinstance(exc, FileNotFoundError) or f"(os error {errno.ENOENT})" in str(exc):
+            raise ConversionError(f"Excel workbook not found: {excel_path}") from exc
+        raise ConversionError(
+            f"Unable to read worksheet '{sheet_name}' from '{excel_path}' "
+            f"(engines tried: calamine): {exc}"
+        ) from exc
+    return ([_sheet_cell(value) for value in row] for row in rows)
+
+
+def _sheet_cell(value: Any) -> Any:
+    """Render whole-number floats as integers, as ``pd.read_excel`` does."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _read_excel_frame(excel_path: Path, sheet_name: SheetSelector) -> pd.DataFrame:
+    """Read a worksheet with the fastest available engine, falling back to openpyxl."""
+    import pandas as pd
+
+    for engine in _EXCEL_READ_ENGINES:
+        try:
+            return pd.read_excel(excel_path, sheet_name=sheet_name, engine=engine)
+        except FileNotFoundError as exc:
+            raise ConversionError(f"Excel workbook not found: {excel_path}") from exc
+        except Exception as exc:
+            error = exc
+    raise ConversionError(
+        f"Unable to read worksheet '{sheet_name}' from '{excel_path}' "
+        f"(engines tried: {', '.join(_EXCEL_READ_ENGINES)}): {error}"
+    ) from error
+
+
+def _is_plain_frame(frame: pd.DataFrame) -> bool:
+    """Return whether ``str()`` renders every cell exactly like ``to_csv`` would.
+
+    Datetimes, categoricals and narrow floats get pandas-specific formatting.
+    """
+    import numpy as np
+    import pandas as pd
+
+    for dtype in frame.dtypes:
+        if isinstance(dtype, pd.StringDtype):
+            continue
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "biufO":
+            return False
+        if dtype.kind == "f" and dtype.itemsize != 8:
+            return False
+    return True
+
+
+def _write_csv_rows(
+    frame: pd.DataFrame,
+    csv_path: Path,
+    *,
+    delimiter: str,
+    encoding: str,
+    include_index: bool,
+    include_header: bool,
+) -> None:
+    """Write ``frame`` to CSV with ``csv.writer`` over its column arrays."""
+    columns = [_csv_row(frame.iloc[:, i].tolist()) for i in range(frame.shape[1])]
+    if include_index:
+        columns.insert(0, _csv_row(frame.index.tolist()))
+    with open(csv_path, "w", encoding=encoding, newline="") as handle:
+        writer = csv.writer(handle, delimiter=delimiter, lineterminator="\n")
+        if include_header:
+            header = list(frame.columns)
+            if include_index:
+                header.insert(0, frame.index.name)
+            writer.writerow(_csv_row(header))
+        writer.writerows(zip(*columns))
+
+
+def _write_csv_transposed(
+    frame: pd.DataFrame,
+    csv_path: Path,
+    *,
+    delimiter: str,
+    encoding: str,
+    include_index: bool,
+    include_header: bool,
+) -> None:
+    """Write ``frame`` to CSV with rows and columns swapped, column by column."""
+    with open(csv_path, "w", encoding=encoding, newline="") as handle:
+        writer = csv.writer(handle, delimiter=delimiter, lineterminator="\n")
+        if include_header:
+            header = list(frame.index)
+            if include_index:
+                header.insert(0, frame.columns.name)
+            writer.writerow(_csv_row(header))
+        writer.writerows(_csv_row(row) for row in _column_rows(frame, include_index))
+
+
+def csv_to_excel_many(
+    pairs: Iterable[tuple[Path, Path]],
+    *,
+    max_workers: Optional[int] = None,
+    **options: Any,
+) -> None:
+    """Convert several CSV files to Excel workbooks in parallel worker processes.
+
+    ``pairs`` holds ``(csv_path, excel_path)`` tuples; ``options`` are forwarded
+    to :func:`csv_to_excel` for every file. Every pair is attempted; if any
+    fail, a single :class:`ConversionError` listing each failure is raised.
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait
+
+    jobs = [(Path(csv_path), Path(excel_path), options) for csv_path, excel_path in pairs]
+    if not jobs:
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_csv_to_excel_job, job) for job in jobs]
+        wait(futures)
+
+    failures = []
+    for (csv_path, _, _), future in zip(jobs, futures):
+        error = future.exception()
+        if error is not None:
+            failures.append(f"{csv_path}: {str(error).strip()}")
+    if failures:
+        raise ConversionError(
+            f"{len(failures)} of {len(jobs)} conversions failed:\n  " + "\n  ".join(failures)
+        )
+
+
+def _csv_to_excel_job(job: tuple[Path, Path, dict[str, Any]]) -> None:
+    csv_path, excel_path, options = job
+    csv_to_excel(csv_path, excel_path, **options)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
 def _sheet_identifier(value: str) -> SheetSelector:
     """Coerce sheet identifiers that look like integers into zero-based indexes."""
     value = value.strip()
@@ -110,11 +857,13 @@ def _sheet_identifier(value: str) -> SheetSelector:
     return value
 
 
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     examples = """
         Examples:
           csv-excel-converter csv-to-excel data/quarterly.csv reports/q1.xlsx
           csv-excel-converter csv-to-excel data/people.csv reports/wide.xlsx --transpose --sheet-name WideView
+          csv-excel-converter csv-to-excel-batch "data/*.csv" reports/ --jobs 4
           csv-excel-converter excel-to-csv reports/q1.xlsx data/q1.csv --sheet-name Q1 --transpose --encoding latin-1 --delimiter ";"
           csv-excel-converter excel-to-csv matrix.xlsx matrix.csv --no-header --include-index
     """
@@ -173,6 +922,57 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     csv_to_excel_parser.set_defaults(func=_command_csv_to_excel)
 
+    batch_parser = subparsers.add_parser(
+        "csv-to-excel-batch",
+        help="Convert every CSV file matching a glob pattern in parallel.",
+    )
+    batch_parser.add_argument(
+        "pattern",
+        help="Glob pattern selecting the source CSV files (quote it; ** is supported).",
+    )
+    batch_parser.add_argument(
+        "output_dir",
+        type=Path,
+        help="Directory receiving one <name>.xlsx workbook per CSV file.",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes (default: one per CPU).",
+    )
+    batch_parser.add_argument(
+        "--sheet-name",
+        default="Sheet1",
+        help="Worksheet name to create (default: Sheet1).",
+    )
+    batch_parser.add_argument(
+        "--delimiter",
+        default=",",
+        help="Input CSV delimiter (default: ',').",
+    )
+    batch_parser.add_argument(
+        "--encoding",
+        default="utf-8",
+        help="Encoding used to read the CSV files (default: utf-8).",
+    )
+    batch_parser.add_argument(
+        "--no-header",
+        action="store_true",
+        help="Treat the first row as data instead of column names.",
+    )
+    batch_parser.add_argument(
+        "--transpose",
+        action="store_true",
+        help="Swap rows and columns before writing to Excel.",
+    )
+    batch_parser.add_argument(
+        "--include-index",
+        action="store_true",
+        help="Persist the row index in each worksheet.",
+    )
+    batch_parser.set_defaults(func=_command_csv_to_excel_batch)
+
     excel_to_csv_parser = subparsers.add_parser(
         "excel-to-csv",
         help="Convert an Excel worksheet into a CSV file.",
@@ -218,6 +1018,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not write column names to the CSV output.",
     )
+    excel_to_csv_parser.add_argument(
+        "--raw-cells",
+        action="store_true",
+        help="Copy stored cell values via python-calamine without pandas (faster; "
+        "headers and number formatting are left as-is).",
+    )
     excel_to_csv_parser.set_defaults(func=_command_excel_to_csv)
 
     return parser
@@ -241,6 +1047,39 @@ def _command_csv_to_excel(args: argparse.Namespace) -> int:
     return 0
 
 
+def _command_csv_to_excel_batch(args: argparse.Namespace) -> int:
+    csv_paths = sorted(Path(match) for match in glob.glob(args.pattern, recursive=True))
+    if not csv_paths:
+        print(f"conversion failed: no files match {args.pattern!r}", file=sys.stderr)
+        return 1
+
+    pairs = [(path, args.output_dir / f"{path.stem}.xlsx") for path in csv_paths]
+    targets = Counter(excel_path for _, excel_path in pairs)
+    duplicates = sorted(str(path) for path, count in targets.items() if count > 1)
+    if duplicates:
+        print(
+            f"conversion failed: several inputs map to {', '.join(duplicates)}",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        csv_to_excel_many(
+            pairs,
+            max_workers=args.jobs,
+            sheet_name=args.sheet_name,
+            delimiter=args.delimiter,
+            encoding=args.encoding,
+            has_header=not args.no_header,
+            transpose=args.transpose,
+            include_index=args.include_index,
+        )
+    except ConversionError as exc:
+        print(f"conversion failed: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
 def _command_excel_to_csv(args: argparse.Namespace) -> int:
     try:
         excel_to_csv(
@@ -252,6 +1091,7 @@ def _command_excel_to_csv(args: argparse.Namespace) -> int:
             transpose=args.transpose,
             include_index=args.include_index,
             include_header=not args.no_header,
+            raw_cells=args.raw_cells,
         )
     except ConversionError as exc:
         print(f"conversion failed: {exc}", file=sys.stderr)
@@ -0,0 +1,261 @@
+"""Round-trip tests for csv_excel_converter_single."""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+import csv_excel_converter_single as converter
+
+
+def _sheet_rows(excel_path: Path) -> list[tuple]:
+    """Return every worksheet row as read back by openpyxl."""
+    workbook = load_workbook(excel_path)
+    try:
+        return list(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def _write_csv(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(params=[True, False], ids=["xlsxwriter", "openpyxl"])
+def workbook_writer(request, monkeypatch):
+    """Run a test once per streaming workbook writer."""
+    if request.param and not converter._HAS_XLSXWRITER:
+        pytest.skip("xlsxwriter is not installed")
+    monkeypatch.setattr(converter, "_HAS_XLSXWRITER", request.param)
+
+
+@pytest.mark.parametrize("transpose", [False, True])
+def test_numeric_bool_and_non_finite_cells(tmp_path, transpose):
+    csv_path = _write_csv(
+        tmp_path / "in.csv",
+        ["ints,floats,flags,special", "1,2.5,True,inf", "2,,False,-inf", "3,0.125,True,"],
+    )
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path, transpose=transpose)
+
+    rows = _sheet_rows(excel_path)
+    if transpose:
+        # Without the index the transposed sheet is headed by row numbers.
+        assert rows[0] == (0, 1, 2)
+        columns = [list(row) for row in rows[1:]]
+    else:
+        assert rows[0] == ("ints", "floats", "flags", "special")
+        columns = [list(column) for column in zip(*rows[1:])]
+    assert columns[0] == [1, 2, 3]
+    assert columns[1] == [2.5, None, 0.125]
+    assert columns[2] == [True, False, True]
+    assert all(isinstance(flag, bool) for flag in columns[2])
+    assert columns[3] == ["inf", "-inf", None]
+
+
+def test_direct_writer_escapes_headers(tmp_path):
+    labels = ["a<b", "c&d", 'say "hi"', "bell\x07", " padded "]
+    frame = pd.DataFrame([[1, 2, 3, 4, 5]], columns=labels)
+    csv_path = tmp_path / "in.csv"
+    frame.to_csv(csv_path, index=False)
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path)
+
+    rows = _sheet_rows(excel_path)
+    assert rows[0] == ("a<b", "c&d", 'say "hi"', "bell", " padded ")
+    assert rows[1] == (1, 2, 3, 4, 5)
+
+
+def test_sheet_name_with_xml_characters(tmp_path):
+    csv_path = _write_csv(tmp_path / "in.csv", ["a", "1"])
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path, sheet_name="R&D <draft>")
+
+    assert load_workbook(excel_path).sheetnames == ["R&D <draft>"]
+
+
+@pytest.mark.usefixtures("workbook_writer")
+@pytest.mark.parametrize("transpose", [False, True])
+def test_text_frames_match_to_excel(tmp_path, transpose):
+    csv_path = _write_csv(
+        tmp_path / "in.csv",
+        ["name,score,note", "ada,1,x", "bob,,y & z", "cy,3.5,"],
+    )
+    expected_path = tmp_path / "expected.xlsx"
+    frame = pd.read_csv(csv_path)
+    (frame.T if transpose else frame).to_excel(expected_path, index=transpose)
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path, transpose=transpose, include_index=transpose)
+
+    assert _sheet_rows(excel_path) == _sheet_rows(expected_path)
+
+
+@pytest.mark.usefixtures("workbook_writer")
+@pytest.mark.parametrize("include_index", [False, True])
+def test_type_change_past_first_chunk(tmp_path, monkeypatch, include_index):
+    monkeypatch.setattr(converter, "_CSV_CHUNK_ROWS", 4)
+    lines = ["code,value"] + [f"{i},{i}" for i in range(10)] + ["A7,10"]
+    csv_path = _write_csv(tmp_path / "in.csv", lines)
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path, include_index=include_index)
+
+    rows = _sheet_rows(excel_path)[1:]
+    if include_index:
+        assert [row[0] for row in rows] == list(range(11))
+        rows = [row[1:] for row in rows]
+    # The whole column turns textual, not just the chunk holding "A7".
+    assert [row[0] for row in rows] == [str(i) for i in range(10)] + ["A7"]
+    assert [row[1] for row in rows] == list(range(11))
+
+
+def test_real_chunk_boundary(tmp_path):
+    rows = converter._CSV_CHUNK_ROWS + 10
+    lines = ["code,value"] + [f"{i},{i % 7}" for i in range(rows)] + ["x1,"]
+    csv_path = _write_csv(tmp_path / "in.csv", lines)
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path)
+
+    values = _sheet_rows(excel_path)
+    assert len(values) == rows + 2
+    assert values[-2] == (str(rows - 1), (rows - 1) % 7)
+    assert values[-1] == ("x1", None)
+
+
+def test_late_blank_in_integer_column_keeps_streaming(tmp_path, monkeypatch):
+    monkeypatch.setattr(converter, "_CSV_CHUNK_ROWS", 4)
+    calls = []
+    read_csv = pd.read_csv
+
+    def record(*args, **kwargs):
+        calls.append(kwargs)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", record)
+    lines = ["a,b"] + [f"{i},{i * 2}" for i in range(10)] + [",5"]
+    csv_path = _write_csv(tmp_path / "in.csv", lines)
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path)
+
+    assert all("nrows" in kwargs or "chunksize" in kwargs for kwargs in calls)
+    rows = _sheet_rows(excel_path)
+    assert [row[0] for row in rows[1:]] == list(range(10)) + [None]
+    assert rows[-1] == (None, 5)
+
+
+@pytest.mark.parametrize("has_header", [True, False])
+def test_chunks_resume_after_blank_and_quoted_lines(tmp_path, monkeypatch, has_header):
+    monkeypatch.setattr(converter, "_CSV_CHUNK_ROWS", 3)
+    lines = ["a,b", '1,"multi\nline"', "", "2,x", "3,y", "", "4,z", "5,w", "6,v"]
+    csv_path = _write_csv(tmp_path / "in.csv", lines)
+    header = 0 if has_header else None
+
+    chunks = list(converter._read_csv_chunks(csv_path, sep=",", encoding="utf-8", header=header))
+
+    expected = pd.read_csv(csv_path, header=header)
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_dtype=False)
+
+
+@pytest.mark.skipif(not converter._HAS_PYARROW, reason="pyarrow is not installed")
+def test_pyarrow_read_matches_c_engine(tmp_path):
+    csv_path = _write_csv(
+        tmp_path / "in.csv",
+        [
+            "flag,word,digits,,dup,dup",
+            "True,false,1,a,1,2",
+            "1,0,TRUE,b,3,4",
+        ],
+    )
+    options = {"sep": ",", "encoding": "utf-8", "header": 0}
+
+    frame = converter._read_csv_frame(csv_path, **options)
+
+    expected = pd.read_csv(csv_path, **options)
+    assert list(frame.columns) == list(expected.columns)
+    assert frame.astype(object).values.tolist() == expected.astype(object).values.tolist()
+
+
+@pytest.mark.skipif(not converter._HAS_PYARROW, reason="pyarrow is not installed")
+def test_transpose_keeps_numeric_looking_text(tmp_path):
+    csv_path = _write_csv(tmp_path / "in.csv", ["a,b", "True,false", "1,0"])
+    excel_path = tmp_path / "out.xlsx"
+
+    converter.csv_to_excel(csv_path, excel_path, transpose=True)
+
+    assert _sheet_rows(excel_path) == [(0, 1), ("True", "1"), ("false", "0")]
+
+
+@pytest.mark.parametrize("transpose", [False, True])
+@pytest.mark.parametrize("include_index", [False, True])
+@pytest.mark.parametrize("include_header", [False, True])
+def test_excel_to_csv_matches_to_csv(tmp_path, transpose, include_index, include_header):
+    frame = pd.DataFrame({"a": [1, 4, 7], "b": [2.5, math.nan, 8.25], "c": ["x", "y", None]})
+    excel_path = tmp_path / "in.xlsx"
+    frame.to_excel(excel_path, index=False)
+    csv_path = tmp_path / "out.csv"
+
+    converter.excel_to_csv(
+        excel_path,
+        csv_path,
+        transpose=transpose,
+        include_index=include_index,
+        include_header=include_header,
+    )
+
+    expected = pd.read_excel(excel_path)
+    if transpose:
+        expected = expected.T
+    expected_text = expected.to_csv(index=include_index, header=include_header, lineterminator="\n")
+    assert csv_path.read_text(encoding="utf-8") == expected_text
+
+
+def test_transpose_upcasts_mixed_numeric_columns(tmp_path):
+    frame = pd.DataFrame({"a": [1, 4, 7], "b": [2.5, math.nan, 8.25]})
+    excel_path = tmp_path / "in.xlsx"
+    frame.to_excel(excel_path, index=False)
+    csv_path = tmp_path / "out.csv"
+
+    converter.excel_to_csv(excel_path, csv_path, transpose=True, include_header=False)
+
+    assert csv_path.read_text(encoding="utf-8") == "1.0,4.0,7.0\n2.5,,8.25\n"
+
+
+def test_csv_round_trip(tmp_path):
+    source = tmp_path / "in.csv"
+    _write_csv(source, ["id,name,score", "1,ada,9.5", "2,bob,", "3,\"c, y\",7.25"])
+    excel_path = tmp_path / "mid.xlsx"
+    target = tmp_path / "out.csv"
+
+    converter.csv_to_excel(source, excel_path)
+    converter.excel_to_csv(excel_path, target)
+
+    assert target.read_text(encoding="utf-8") == source.read_text(encoding="utf-8")
+
+
+def test_empty_csv_reports_parse_error(tmp_path):
+    csv_path = tmp_path / "empty.csv"
+    csv_path.write_text("", encoding="utf-8")
+
+    with pytest.raises(converter.ConversionError, match="No columns to parse"):
+        converter.csv_to_excel(csv_path, tmp_path / "out.xlsx")
+
+
+@pytest.mark.skipif(not converter._HAS_CALAMINE, reason="python-calamine is not installed")
+def test_raw_cells_missing_workbook(tmp_path):
+    with pytest.raises(converter.ConversionError, match="Excel workbook not found"):
+        converter.excel_to_csv(tmp_path / "missing.xlsx", tmp_path / "out.csv", raw_cells=True)
+
+
+def test_missing_workbook(tmp_path):
+    with pytest.raises(converter.ConversionError, match="Excel workbook not found"):
+        converter.excel_to_csv(tmp_path / "missing.xlsx", tmp_path / "out.csv")